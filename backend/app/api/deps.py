@@ -52,8 +52,16 @@ def get_pagination_params(
     limit: int = settings.pagination_default_limit,
     offset: int = 0,
     search: str = None,
+    cursor: str = None,
+    include_total: bool = False,
 ) -> PaginationQuery:
-    return PaginationQuery(limit=limit, offset=offset, search=search)
+    return PaginationQuery(
+        limit=limit,
+        offset=offset,
+        search=search,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
 
 from ..services.locations import LocationService
@@ -44,6 +44,8 @@ async def list_sensor_sites(
         limit=limit,
         offset=offset,
         search=pagination.search,
+        cursor=pagination.cursor,
+        include_total=pagination.include_total,
     )
 
 
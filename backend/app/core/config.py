@@ -51,6 +51,14 @@ class Settings:
     pagination_max_limit:
         Safety guard to prevent accidental data dumps that could strain shared
         infrastructure.
+    database_pool_size:
+        Number of persistent connections the engine keeps open so requests
+        reuse warm connections instead of reconnecting.
+    database_max_overflow:
+        Extra connections allowed above the pool size during traffic bursts.
+    database_pool_recycle:
+        Seconds after which pooled connections are replaced, guarding against
+        servers or firewalls that drop idle links.
     """
 
     database_url: str = os.getenv(
@@ -70,6 +78,15 @@ class Settings:
         "LIFELINE_PAGINATION_MAX_LIMIT",
         100,
     )
+    database_pool_size: int = _int_from_env("LIFELINE_DATABASE_POOL_SIZE", 10)
+    database_max_overflow: int = _int_from_env(
+        "LIFELINE_DATABASE_MAX_OVERFLOW",
+        20,
+    )
+    database_pool_recycle: int = _int_from_env(
+        "LIFELINE_DATABASE_POOL_RECYCLE",
+        1800,
+    )
 
 
 settings = Settings()
@@ -9,7 +9,9 @@ back any errors, ensuring the integrity of institutional data.
 
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Any, Dict
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -27,7 +29,30 @@ class Base(DeclarativeBase):
     pass
 
 
-engine: AsyncEngine = create_async_engine(settings.database_url, echo=False)
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Return pool options suited to the configured database.
+
+    In-memory SQLite runs on a single static connection that cannot be pooled,
+    so sizing options are only applied to file-backed and server databases.
+    """
+
+    url = make_url(database_url)
+    in_memory = url.database in (None, "", ":memory:")
+    if url.get_backend_name() == "sqlite" and in_memory:
+        return {}
+    return {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_recycle": settings.database_pool_recycle,
+    }
+
+
+engine: AsyncEngine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    **_engine_options(settings.database_url),
+)
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..core.database import Base
@@ -72,6 +72,15 @@ class MaintenanceTicket(TimestampMixin, Base):
         back_populates="maintenance_tickets",
     )
 
+    __table_args__ = (
+        Index(
+            "ix_maintenance_tickets_open_by_resource",
+            "resource_id",
+            postgresql_where=text("status != 'CLOSED'"),
+            sqlite_where=text("status != 'CLOSED'"),
+        ),
+    )
+
     def __repr__(self) -> str:  # pragma: no cover - repr aids debugging
         """Representation for logging and debugging."""
 
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, Generic, Optional, Sequence, Tuple, Type, TypeVar
 
-from sqlalchemy import Select, func, or_, select
+from sqlalchemy import Select, func, inspect, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import ColumnElement
 
@@ -51,15 +51,17 @@ class AsyncRepository(Generic[ModelType]):
     ) -> Select[tuple[ModelType]]:
         """
         Apply case-insensitive LIKE filters across configured search fields.
+
+        ``ILIKE`` on the bare column (rather than ``lower(column) LIKE``) lets
+        PostgreSQL answer the match from the ``pg_trgm`` GIN indexes; SQLite
+        compiles it to an equivalent ``lower() LIKE lower()`` comparison.
         """
 
         if not search or not self.searchable_fields:
             return stmt
 
-        pattern = f"%{search.lower()}%"
-        conditions = [
-            func.lower(field).like(pattern) for field in self.searchable_fields
-        ]
+        pattern = f"%{search}%"
+        conditions = [field.ilike(pattern) for field in self.searchable_fields]
         return stmt.where(or_(*conditions))
 
     async def list(
@@ -73,19 +75,61 @@ class AsyncRepository(Generic[ModelType]):
         Retrieve a paginated set of entities.
 
         Returns both the result set and the total count for pagination metadata.
+        The total is computed with a ``COUNT(*) OVER ()`` window so the page and
+        its count come back from a single scan; a separate ``COUNT`` is only
+        issued when the requested page lies past the end of the result set.
+        Rows are ordered by primary key, so the last id of an offset page is a
+        valid starting point for ``list_after``.
+        """
+
+        stmt = self._base_select().add_columns(
+            func.count().over().label("total")
+        )
+        stmt = self._apply_search(stmt, search)
+        result = await self.session.execute(
+            stmt.order_by(self.model.id).offset(offset).limit(limit)
+        )
+        rows = result.all()
+        items = [row[0] for row in rows]
+
+        if rows:
+            total = rows[0].total
+        elif offset == 0:
+            total = 0
+        else:
+            total = await self.count(search=search)
+
+        return items, int(total or 0)
+
+    async def list_after(
+        self,
+        *,
+        limit: int,
+        after_id: Optional[int],
+        search: Optional[str] = None,
+    ) -> Sequence[ModelType]:
+        """
+        Retrieve a keyset page ordered by primary key.
+
+        Rows are filtered with ``id > after_id`` rather than skipped with an
+        ``OFFSET``, so deep pages cost the same as the first one.
         """
 
         stmt = self._apply_search(self._base_select(), search)
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
         result = await self.session.execute(
-            stmt.offset(offset).limit(limit)
+            stmt.order_by(self.model.id).limit(limit)
         )
-        items = result.scalars().all()
+        return result.scalars().all()
+
+    async def count(self, *, search: Optional[str] = None) -> int:
+        """Return the number of entities matching the optional search."""
 
         count_stmt = select(func.count()).select_from(self.model)
         count_stmt = self._apply_search(count_stmt, search)  # type: ignore[arg-type]
         total = await self.session.scalar(count_stmt)
-
-        return items, int(total or 0)
+        return int(total or 0)
 
     async def get(self, entity_id: Any) -> Optional[ModelType]:
         """Fetch a single entity by primary key."""
@@ -93,12 +137,20 @@ class AsyncRepository(Generic[ModelType]):
         return await self.session.get(self.model, entity_id)
 
     async def create(self, data: Dict[str, Any]) -> ModelType:
-        """Create a new entity using the provided data mapping."""
+        """
+        Create a new entity using the provided data mapping.
+
+        Server-generated columns normally come back through the ``INSERT``'s
+        ``RETURNING`` clause, so the entity is only refreshed when the backend
+        left some of them expired.
+        """
 
         entity = self.model(**data)
         self.session.add(entity)
         await self.session.flush()
-        await self.session.refresh(entity)
+        expired = inspect(entity).expired_attributes
+        if expired:
+            await self.session.refresh(entity, attribute_names=list(expired))
         return entity
 
     async def update(
@@ -115,6 +167,12 @@ class AsyncRepository(Generic[ModelType]):
         return entity
 
     async def delete(self, entity: ModelType) -> None:
-        """Delete an entity."""
+        """
+        Delete an entity.
+
+        The delete is flushed straight away, like ``create`` and ``update``,
+        so flush listeners such as the service reference cache see it.
+        """
 
         await self.session.delete(entity)
+        await self.session.flush()
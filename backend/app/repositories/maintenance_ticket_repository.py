@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from typing import Any, Dict, Optional
+
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import MaintenanceTicket
@@ -18,3 +21,25 @@ class MaintenanceTicketRepository(AsyncRepository[MaintenanceTicket]):
 
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, MaintenanceTicket)
+
+    async def update_returning(
+        self,
+        ticket_id: int,
+        data: Dict[str, Any],
+    ) -> Optional[MaintenanceTicket]:
+        """
+        Update a ticket in a single ``UPDATE ... RETURNING`` statement.
+
+        The written row comes back with the statement, so no follow-up
+        ``SELECT`` is needed to refresh server-side values such as
+        ``updated_at``. ``None`` is returned when no ticket matched.
+        """
+
+        stmt = (
+            update(MaintenanceTicket)
+            .where(MaintenanceTicket.id == ticket_id)
+            .values(**data)
+            .returning(MaintenanceTicket)
+            .execution_options(synchronize_session="fetch")
+        )
+        return await self.session.scalar(stmt)
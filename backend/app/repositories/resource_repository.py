@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import ICTResource
+from ..models import ICTResource, MaintenanceTicket, TicketStatus
 from .base import AsyncRepository
 
 
@@ -19,3 +22,32 @@ class ResourceRepository(AsyncRepository[ICTResource]):
 
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, ICTResource)
+
+    async def get_with_unresolved_ticket_flag(
+        self,
+        resource_id: int,
+    ) -> tuple[Optional[ICTResource], bool]:
+        """
+        Fetch a resource together with whether it has unresolved tickets.
+
+        The ticket probe is a correlated ``EXISTS`` in the same ``SELECT`` so
+        the delete guard needs one round-trip instead of two. The statement is
+        a ``lambda_stmt`` so its construction is cached and only
+        ``resource_id`` is re-bound per call.
+        """
+
+        stmt = lambda_stmt(
+            lambda: select(
+                ICTResource,
+                select(MaintenanceTicket.id)
+                .where(
+                    MaintenanceTicket.resource_id == ICTResource.id,
+                    MaintenanceTicket.status != TicketStatus.CLOSED,
+                )
+                .exists(),
+            ).where(ICTResource.id == resource_id)
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return None, False
+        return row[0], bool(row[1])
@@ -4,15 +4,13 @@ from __future__ import annotations
 
 from typing import Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, Field
-from pydantic.generics import GenericModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BaseSchema(BaseModel):
     """Base schema that enables ORM compatibility."""
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaginationQuery(BaseModel):
@@ -27,6 +25,11 @@ class PaginationQuery(BaseModel):
         Starting index of the page.
     search:
         Optional free-text search term applied to select fields.
+    cursor:
+        Opaque keyset cursor returned by a previous page. When supplied the
+        ``offset`` is ignored and the page starts after the encoded record.
+    include_total:
+        Whether cursor pages should also report the total match count.
     """
 
     limit: Optional[int] = Field(
@@ -43,20 +46,40 @@ class PaginationQuery(BaseModel):
         default=None,
         description="Case-insensitive free-text search phrase.",
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from a previous page's ``next_cursor``.",
+    )
+    include_total: bool = Field(
+        default=False,
+        description="Count all matches for cursor pages (costs a COUNT query).",
+    )
 
 
 class PaginationMeta(BaseModel):
     """Metadata describing a paginated result set."""
 
-    total: int = Field(..., ge=0, description="Total number of matching items.")
+    total: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Total number of matching items, omitted for cursor pages.",
+    )
     limit: int = Field(..., ge=1, description="Page size returned.")
     offset: int = Field(..., ge=0, description="Zero-based offset that produced the page.")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the following page, or null on the last page.",
+    )
+    has_more: bool = Field(
+        default=False,
+        description="Whether another page follows this one.",
+    )
 
 
 T = TypeVar("T")
 
 
-class PaginatedResponse(GenericModel, Generic[T]):
+class PaginatedResponse(BaseModel, Generic[T]):
     """
     Envelope for paginated API responses.
 
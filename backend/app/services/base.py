@@ -8,31 +8,109 @@ CLI scripts, background jobs, and API endpoints.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Sequence, Type, TypeVar
+import base64
+import binascii
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
 
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, event, inspect, literal, select, union_all
+from sqlalchemy.sql import Executable
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from ..repositories import AsyncRepository
 from ..schemas import BaseSchema, PaginatedResponse, PaginationMeta
-from .exceptions import NotFoundError
+from .exceptions import NotFoundError, ValidationError
 
 
 SchemaType = TypeVar("SchemaType", bound=BaseSchema)
 
+#: ``(model, primary key, label)`` triple checked by ``ensure_references_exist``.
+Reference = Tuple[Any, Optional[int], str]
+
+#: ``Session.info`` key holding the references verified on that session.
+_VERIFIED_REFERENCES = "verified_references"
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[SchemaType]) -> TypeAdapter[List[SchemaType]]:
+    """Return a reusable adapter validating a list of ``schema`` items."""
+
+    return TypeAdapter(List[schema])  # type: ignore[valid-type]
+
+
+@lru_cache(maxsize=64)
+def _reference_check_statement(models: Tuple[Any, ...]) -> Executable:
+    """
+    Build, once per combination of models, the ``UNION ALL`` existence check.
+
+    Identifiers are left as ``ref_<position>`` bind parameters so the same
+    statement object, and SQLAlchemy's compiled form of it, is reused for
+    every call with the same shape.
+    """
+
+    branches = [
+        select(literal(position).label("position")).where(
+            model.id == bindparam(f"ref_{position}")
+        )
+        for position, model in enumerate(models)
+    ]
+    return branches[0] if len(branches) == 1 else union_all(*branches)
+
+
+@event.listens_for(Session, "after_flush")
+def _forget_deleted_references(session: Session, flush_context: Any) -> None:
+    """Drop rows deleted by this flush, cascades included, from the cache."""
+
+    cache = session.info.get(_VERIFIED_REFERENCES)
+    if not cache:
+        return
+    for entity in session.deleted:
+        # The identity key is read from instance state, so no attribute is
+        # loaded from inside the flush.
+        identity = inspect(entity).identity
+        if identity is not None:
+            cache.pop((type(entity).__tablename__, identity[0]), None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_references_on_rollback(
+    session: Session,
+    previous_transaction: Any,
+) -> None:
+    """Clear the cache, since rows created in the rolled-back work are gone."""
+
+    session.info.pop(_VERIFIED_REFERENCES, None)
+
 
 class BaseService:
     """Provide convenience methods shared by concrete services."""
 
+    #: Upper bound on verified references remembered per session.
+    reference_cache_size: int = 1024
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    @property
+    def _verified_references(self) -> OrderedDict[Tuple[str, int], None]:
+        """References confirmed on this session, shared by all its services."""
+
+        return self.session.info.setdefault(_VERIFIED_REFERENCES, OrderedDict())
+
     def build_paginated_response(
         self,
         *,
         items: Sequence[Any],
-        total: int,
+        total: Optional[int],
         limit: int,
         offset: int,
         schema: Type[SchemaType],
+        next_cursor: Optional[str] = None,
+        has_more: Optional[bool] = None,
+        keyset: bool = False,
     ) -> PaginatedResponse[SchemaType]:
         """
         Convert ORM objects into a paginated schema response.
@@ -42,21 +120,169 @@ class BaseService:
         items:
             Iterable of ORM objects.
         total:
-            Total number of matching items.
+            Total number of matching items, or ``None`` for cursor pages.
         limit:
             Page size.
         offset:
             Offset used for the query.
         schema:
             Pydantic schema used for serialisation.
+        next_cursor:
+            Keyset cursor for the following page, if any.
+        has_more:
+            Whether another page follows. Derived from ``total`` when omitted.
+        keyset:
+            Whether the list supports cursors. If so, an offset page that has
+            a successor gets a ``next_cursor`` from its last item, so clients
+            can switch to keyset pagination after the first page.
         """
 
-        data = [schema.from_orm(item) for item in items]
+        if has_more is None:
+            has_more = total is not None and offset + len(items) < total
+        if keyset and next_cursor is None and has_more and items:
+            next_cursor = self.encode_cursor(items[-1].id)
+        data = _list_adapter(schema).validate_python(
+            items,
+            from_attributes=True,
+        )
         return PaginatedResponse[SchemaType](
             data=data,
-            pagination=PaginationMeta(total=total, limit=limit, offset=offset),
+            pagination=PaginationMeta(
+                total=total,
+                limit=limit,
+                offset=offset,
+                next_cursor=next_cursor,
+                has_more=has_more,
+            ),
+        )
+
+    async def build_cursor_page(
+        self,
+        *,
+        repository: AsyncRepository[Any],
+        cursor: str,
+        limit: int,
+        search: Optional[str],
+        schema: Type[SchemaType],
+        include_total: bool = False,
+    ) -> PaginatedResponse[SchemaType]:
+        """
+        Fetch and serialise a keyset page starting after ``cursor``.
+
+        One extra row is requested to learn whether another page exists, so
+        no ``COUNT(*)`` is needed unless the caller asks for ``include_total``.
+        """
+
+        items = await repository.list_after(
+            limit=limit + 1,
+            after_id=self.decode_cursor(cursor),
+            search=search,
+        )
+        has_more = len(items) > limit
+        items = items[:limit]
+        total = (
+            await repository.count(search=search) if include_total else None
+        )
+        return self.build_paginated_response(
+            items=items,
+            total=total,
+            limit=limit,
+            offset=0,
+            schema=schema,
+            next_cursor=self.encode_cursor(items[-1].id) if has_more else None,
+            has_more=has_more,
         )
 
+    @staticmethod
+    def encode_cursor(last_id: int) -> str:
+        """Encode the last primary key of a page as an opaque cursor."""
+
+        return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+        """
+        Decode a cursor produced by ``encode_cursor``.
+
+        Raises a ``ValidationError`` when the cursor has been tampered with so
+        the API answers with a 400 rather than a server error.
+        """
+
+        if cursor is None:
+            return None
+        try:
+            return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise ValidationError("Invalid pagination cursor.") from exc
+
+    async def ensure_references_exist(
+        self,
+        references: Sequence[Reference],
+    ) -> None:
+        """
+        Verify that every referenced entity exists using a single query.
+
+        Each non-null reference contributes one ``SELECT`` branch to a
+        ``UNION ALL`` so all foreign keys are checked in one round-trip. The
+        first missing reference, in the order given, raises a
+        ``ValidationError`` naming it with ``label``.
+
+        References that were already confirmed on this session are served
+        from a small LRU cache, so bulk imports that reuse a handful of
+        projects or locations skip the query entirely. Only positive results
+        are cached. The cache lives in ``session.info``, so every service on
+        the session shares it. Rows the session deletes are evicted at flush,
+        and a rollback clears the cache.
+        """
+
+        cache = self._verified_references
+        checks = []
+        for model, entity_id, label in references:
+            if entity_id is None:
+                continue
+            key = (model.__tablename__, entity_id)
+            if key in cache:
+                cache.move_to_end(key)
+                continue
+            checks.append((model, entity_id, label))
+        if not checks:
+            return
+
+        stmt = _reference_check_statement(
+            tuple(model for model, _, _ in checks)
+        )
+        params = {
+            f"ref_{position}": entity_id
+            for position, (_, entity_id, _) in enumerate(checks)
+        }
+        found = set((await self.session.execute(stmt, params)).scalars())
+
+        for position, (model, entity_id, label) in enumerate(checks):
+            if position not in found:
+                raise ValidationError(f"{label} {entity_id} does not exist.")
+            cache[(model.__tablename__, entity_id)] = None
+            if len(cache) > self.reference_cache_size:
+                cache.popitem(last=False)
+
+    @staticmethod
+    def changed_reference(
+        entity: Any,
+        data: Dict[str, Any],
+        field: str,
+    ) -> Optional[int]:
+        """
+        Return the new foreign key in ``data`` only if it differs from ``entity``.
+
+        Unchanged or omitted references were validated when first stored, so
+        callers can pass the result straight to ``ensure_references_exist`` and
+        skip re-checking them.
+        """
+
+        value = data.get(field)
+        if value == getattr(entity, field):
+            return None
+        return value
+
     @staticmethod
     def ensure_entity(entity: Optional[Any], message: str) -> Any:
         """
@@ -6,7 +6,6 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import ICTResource, MaintenanceTicket, TicketStatus
@@ -88,9 +87,6 @@ class MaintenanceTicketService(BaseService):
         )
 
         data = payload.dict(exclude_unset=True)
-        if "resource_id" in data:
-            await self._validate_resource(data["resource_id"])
-
         status = data.get("status", ticket.status)
         notes = data.get("notes", ticket.notes)
         closed_at = data.get("closed_at", ticket.closed_at)
@@ -99,8 +95,13 @@ class MaintenanceTicketService(BaseService):
             notes=notes,
             closed_at=closed_at,
         )
+        if not data:
+            return TicketRead.from_orm(ticket)
 
-        updated = await self.repository.update(ticket, data)
+        updated = self.ensure_entity(
+            await self.repository.update_returning(ticket_id, data),
+            f"Maintenance ticket {ticket_id} not found.",
+        )
         logger.info("Updated maintenance ticket %s", ticket_id)
         return TicketRead.from_orm(updated)
 
@@ -117,11 +118,9 @@ class MaintenanceTicketService(BaseService):
     async def _validate_resource(self, resource_id: int) -> None:
         """Ensure the referenced resource exists."""
 
-        exists = await self.session.scalar(
-            select(ICTResource.id).where(ICTResource.id == resource_id)
+        await self.ensure_references_exist(
+            [(ICTResource, resource_id, "ICT resource")]
         )
-        if not exists:
-            raise ValidationError(f"ICT resource {resource_id} does not exist.")
 
     @staticmethod
     def _validate_resolution_fields(
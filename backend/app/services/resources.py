@@ -5,16 +5,9 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import (
-    ICTResource,
-    Location,
-    MaintenanceTicket,
-    Project,
-    TicketStatus,
-)
+from ..models import Location, Project
 from ..repositories import ResourceRepository
 from ..schemas import (
     PaginatedResponse,
@@ -41,8 +34,26 @@ class ResourceService(BaseService):
         limit: int,
         offset: int,
         search: Optional[str],
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> PaginatedResponse[ResourceRead]:
-        """Return a paginated list of resources."""
+        """
+        Return a paginated list of resources.
+
+        Supplying ``cursor`` switches to keyset pagination: the page starts
+        after the encoded id and the total is only counted on request. Offset
+        pages carry the ``next_cursor`` that starts the keyset walk.
+        """
+
+        if cursor is not None:
+            return await self.build_cursor_page(
+                repository=self.repository,
+                cursor=cursor,
+                limit=limit,
+                search=search,
+                schema=ResourceRead,
+                include_total=include_total,
+            )
 
         items, total = await self.repository.list(
             limit=limit,
@@ -55,6 +66,7 @@ class ResourceService(BaseService):
             limit=limit,
             offset=offset,
             schema=ResourceRead,
+            keyset=True,
         )
 
     async def get_resource(self, resource_id: int) -> ResourceRead:
@@ -91,8 +103,8 @@ class ResourceService(BaseService):
 
         data = payload.dict(exclude_unset=True)
         await self._validate_relationships(
-            project_id=data.get("project_id"),
-            location_id=data.get("location_id"),
+            project_id=self.changed_reference(resource, data, "project_id"),
+            location_id=self.changed_reference(resource, data, "location_id"),
         )
 
         updated = await self.repository.update(resource, data)
@@ -102,20 +114,15 @@ class ResourceService(BaseService):
     async def delete_resource(self, resource_id: int) -> None:
         """Delete a resource when no active maintenance tickets exist."""
 
-        resource: ICTResource = self.ensure_entity(
-            await self.repository.get(resource_id),
+        (
+            resource,
+            has_unresolved_ticket,
+        ) = await self.repository.get_with_unresolved_ticket_flag(resource_id)
+        resource = self.ensure_entity(
+            resource,
             f"ICT resource {resource_id} not found.",
         )
-
-        unresolved_ticket = await self.session.scalar(
-            select(MaintenanceTicket.id)
-            .where(
-                MaintenanceTicket.resource_id == resource_id,
-                MaintenanceTicket.status != TicketStatus.CLOSED,
-            )
-            .limit(1)
-        )
-        if unresolved_ticket:
+        if has_unresolved_ticket:
             raise ValidationError(
                 "Cannot delete a resource with unresolved maintenance tickets."
             )
@@ -131,20 +138,9 @@ class ResourceService(BaseService):
     ) -> None:
         """Ensure referenced entities exist before persisting."""
 
-        if project_id is not None:
-            exists = await self.session.scalar(
-                select(Project.id).where(Project.id == project_id)
-            )
-            if not exists:
-                raise ValidationError(
-                    f"Project {project_id} does not exist."
-                )
-
-        if location_id is not None:
-            exists = await self.session.scalar(
-                select(Location.id).where(Location.id == location_id)
-            )
-            if not exists:
-                raise ValidationError(
-                    f"Location {location_id} does not exist."
-                )
+        await self.ensure_references_exist(
+            [
+                (Project, project_id, "Project"),
+                (Location, location_id, "Location"),
+            ]
+        )
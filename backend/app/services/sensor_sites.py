@@ -5,7 +5,6 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import ICTResource, Location, Project, SensorSite
@@ -17,7 +16,6 @@ from ..schemas import (
     SensorSiteUpdate,
 )
 from .base import BaseService
-from .exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +33,26 @@ class SensorSiteService(BaseService):
         limit: int,
         offset: int,
         search: Optional[str],
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> PaginatedResponse[SensorSiteRead]:
-        """Return a paginated list of sensor sites."""
+        """
+        Return a paginated list of sensor sites.
+
+        Supplying ``cursor`` switches to keyset pagination: the page starts
+        after the encoded id and the total is only counted on request. Offset
+        pages carry the ``next_cursor`` that starts the keyset walk.
+        """
+
+        if cursor is not None:
+            return await self.build_cursor_page(
+                repository=self.repository,
+                cursor=cursor,
+                limit=limit,
+                search=search,
+                schema=SensorSiteRead,
+                include_total=include_total,
+            )
 
         items, total = await self.repository.list(
             limit=limit,
@@ -49,6 +65,7 @@ class SensorSiteService(BaseService):
             limit=limit,
             offset=offset,
             schema=SensorSiteRead,
+            keyset=True,
         )
 
     async def get_sensor_site(self, site_id: int) -> SensorSiteRead:
@@ -89,9 +106,9 @@ class SensorSiteService(BaseService):
 
         data = payload.dict(exclude_unset=True)
         await self._validate_relationships(
-            resource_id=site.resource_id,
-            project_id=data.get("project_id", site.project_id),
-            location_id=data.get("location_id", site.location_id),
+            resource_id=None,
+            project_id=self.changed_reference(site, data, "project_id"),
+            location_id=self.changed_reference(site, data, "location_id"),
         )
 
         updated = await self.repository.update(site, data)
@@ -111,30 +128,16 @@ class SensorSiteService(BaseService):
     async def _validate_relationships(
         self,
         *,
-        resource_id: int,
+        resource_id: Optional[int],
         project_id: Optional[int],
         location_id: Optional[int],
     ) -> None:
         """Ensure referenced entities exist prior to persistence."""
 
-        resource_exists = await self.session.scalar(
-            select(ICTResource.id).where(ICTResource.id == resource_id)
+        await self.ensure_references_exist(
+            [
+                (ICTResource, resource_id, "ICT resource"),
+                (Project, project_id, "Project"),
+                (Location, location_id, "Location"),
+            ]
         )
-        if not resource_exists:
-            raise ValidationError(f"ICT resource {resource_id} does not exist.")
-
-        if project_id is not None:
-            project_exists = await self.session.scalar(
-                select(Project.id).where(Project.id == project_id)
-            )
-            if not project_exists:
-                raise ValidationError(f"Project {project_id} does not exist.")
-
-        if location_id is not None:
-            location_exists = await self.session.scalar(
-                select(Location.id).where(Location.id == location_id)
-            )
-            if not location_exists:
-                raise ValidationError(
-                    f"Location {location_id} does not exist."
-                )
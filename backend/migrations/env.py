@@ -39,6 +39,17 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip indexes that exist only in migrations during autogenerate.
+
+    The pg_trgm GIN indexes are created by a migration that also enables the
+    extension; they are not on the models, so autogenerate must not drop them.
+    """
+    if type_ == "index" and reflected and name and name.endswith("_trgm"):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -57,6 +68,8 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -69,14 +82,28 @@ def run_migrations_online() -> None:
     In this scenario we need to create an Engine
     and associate a connection with the context.
 
+    Each revision runs in its own transaction so that revisions using
+    ``autocommit_block()`` (for ``CREATE INDEX CONCURRENTLY``) only release
+    their own locks, and a failure leaves earlier revisions applied.
+
     """
-        with connectable.connect() as connection:
-            context.configure(
-                connection=connection, target_metadata=target_metadata
-            )
-    
-            with context.begin_transaction():
-                context.run_migrations()
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            transaction_per_migration=True,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
 
 if context.is_offline_mode():
     run_migrations_offline()
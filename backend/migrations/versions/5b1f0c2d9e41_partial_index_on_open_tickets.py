@@ -0,0 +1,48 @@
+"""partial index on open tickets
+
+Revision ID: 5b1f0c2d9e41
+Revises: 2719deccf5d0
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1f0c2d9e41'
+down_revision: Union[str, Sequence[str], None] = '2719deccf5d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The index is built CONCURRENTLY on PostgreSQL so ticket writes are not
+    blocked while it builds; that cannot run inside a transaction, hence the
+    autocommit block.
+    """
+    # Only unresolved tickets block resource deletion, so index just those.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_maintenance_tickets_open_by_resource',
+            'maintenance_tickets',
+            ['resource_id'],
+            unique=False,
+            postgresql_where=sa.text("status != 'CLOSED'"),
+            sqlite_where=sa.text("status != 'CLOSED'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_maintenance_tickets_open_by_resource',
+            table_name='maintenance_tickets',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,63 @@
+"""trigram search indexes
+
+Revision ID: c4d92e6b7a13
+Revises: 5b1f0c2d9e41
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d92e6b7a13'
+down_revision: Union[str, Sequence[str], None] = '5b1f0c2d9e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ('ix_ict_resources_name_trgm', 'ict_resources', 'name'),
+    ('ix_ict_resources_category_trgm', 'ict_resources', 'category'),
+    ('ix_ict_resources_serial_number_trgm', 'ict_resources', 'serial_number'),
+    (
+        'ix_sensor_sites_data_collection_endpoint_trgm',
+        'sensor_sites',
+        'data_collection_endpoint',
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm GIN indexes serve the repositories' ILIKE '%term%' search; other
+    # dialects have no equivalent, so they keep scanning.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    # Build CONCURRENTLY so inventory edits are not blocked meanwhile.
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name, table, _ in TRIGRAM_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+            )
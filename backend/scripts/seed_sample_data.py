@@ -9,10 +9,17 @@ sensor sites, and maintenance tickets.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
-
-from sqlalchemy import delete
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from datetime import datetime, timezone
+from typing import Any, Dict, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from ..app.core.config import settings
 from ..app.core.database import Base
@@ -29,67 +36,131 @@ from ..app.models import (
 )
 
 
+async def _ensure_row(
+    session: AsyncSession,
+    model: Any,
+    values: Dict[str, Any],
+    *,
+    key: Sequence[str],
+    unique: bool = False,
+) -> int:
+    """
+    Insert ``values`` unless a row matching the ``key`` columns exists.
+
+    Returns the id of the new or existing row. Tables with a unique constraint
+    on ``key`` use ``INSERT ... ON CONFLICT DO NOTHING`` so concurrent runs
+    cannot race; the others are looked up before inserting.
+    """
+
+    lookup = select(model.id).filter_by(
+        **{column: values[column] for column in key}
+    )
+    if unique:
+        is_postgres = session.bind.dialect.name == "postgresql"
+        dialect_insert = pg_insert if is_postgres else sqlite_insert
+        stmt = (
+            dialect_insert(model)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=list(key))
+            .returning(model.id)
+        )
+    else:
+        existing_id = await session.scalar(lookup)
+        if existing_id is not None:
+            return existing_id
+        stmt = insert(model).values(**values).returning(model.id)
+
+    row_id = await session.scalar(stmt)
+    if row_id is None:
+        row_id = await session.scalar(lookup)
+    return row_id
+
+
 async def seed() -> None:
-    """Populate the database with illustrative entities."""
+    """
+    Populate the database with illustrative entities.
+
+    Seeding is idempotent: records that already exist are left untouched, so
+    the script can be rerun without wiping data added between runs.
+    """
 
+    now = datetime.now(timezone.utc)
     engine = create_async_engine(settings.database_url, echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
     SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
     async with SessionLocal() as session:
-        await session.execute(delete(MaintenanceTicket))
-        await session.execute(delete(SensorSite))
-        await session.execute(delete(ICTResource))
-        await session.execute(delete(Location))
-        await session.execute(delete(Project))
-        await session.commit()
-
-        project = Project(
-            name="Smart Campus Connectivity",
-            description="Deploy resilient Wi-Fi and wired networks across all faculties.",
-            status=ProjectStatus.IN_PROGRESS,
-            sponsor="ICT Directorate",
-            primary_contact_email=settings.contact_email,
+        project_id = await _ensure_row(
+            session,
+            Project,
+            {
+                "name": "Smart Campus Connectivity",
+                "description": "Deploy resilient Wi-Fi and wired networks across all faculties.",
+                "status": ProjectStatus.IN_PROGRESS,
+                "sponsor": "ICT Directorate",
+                "primary_contact_email": settings.contact_email,
+            },
+            key=("name",),
+            unique=True,
         )
 
-        location = Location(
-            campus="Kampala Main",
-            building="Innovation Hub",
-            room="Lab 3",
-            latitude=0.3476,
-            longitude=32.5825,
+        location_id = await _ensure_row(
+            session,
+            Location,
+            {
+                "campus": "Kampala Main",
+                "building": "Innovation Hub",
+                "room": "Lab 3",
+                "geom": "SRID=4326;POINT(32.5825 0.3476)",
+            },
+            key=("campus", "building", "room"),
         )
 
-        resource = ICTResource(
-            name="Main Core Switch",
-            category="network",
-            lifecycle_state=LifecycleState.ACTIVE,
-            serial_number="SW-UG-001",
-            description="Handles backbone aggregation for the central campus.",
-            project=project,
-            location=location,
+        resource_id = await _ensure_row(
+            session,
+            ICTResource,
+            {
+                "name": "Main Core Switch",
+                "category": "network",
+                "lifecycle_state": LifecycleState.ACTIVE,
+                "serial_number": "SW-UG-001",
+                "description": "Handles backbone aggregation for the central campus.",
+                "project_id": project_id,
+                "location_id": location_id,
+            },
+            key=("serial_number",),
+            unique=True,
         )
 
-        sensor_site = SensorSite(
-            resource=resource,
-            project=project,
-            location=location,
-            data_collection_endpoint="http://127.0.0.1:5000/data",
-            notes="Feeds rainfall telemetry into analytics modules.",
+        await _ensure_row(
+            session,
+            SensorSite,
+            {
+                "resource_id": resource_id,
+                "project_id": project_id,
+                "location_id": location_id,
+                "data_collection_endpoint": "http://127.0.0.1:5000/data",
+                "notes": "Feeds rainfall telemetry into analytics modules.",
+            },
+            key=("resource_id", "data_collection_endpoint"),
         )
 
-        ticket = MaintenanceTicket(
-            resource=resource,
-            reported_by="noc@lifeline.example.edu",
-            issue_summary="Observed intermittent packet loss during peak hours.",
-            severity=TicketSeverity.MEDIUM,
-            status=TicketStatus.IN_PROGRESS,
-            opened_at=datetime.utcnow(),
-            notes="Monitoring in progress by network operations.",
+        await _ensure_row(
+            session,
+            MaintenanceTicket,
+            {
+                "resource_id": resource_id,
+                "reported_by": "noc@lifeline.example.edu",
+                "issue_summary": "Observed intermittent packet loss during peak hours.",
+                "severity": TicketSeverity.MEDIUM,
+                "status": TicketStatus.IN_PROGRESS,
+                "opened_at": now,
+                "notes": "Monitoring in progress by network operations.",
+            },
+            key=("resource_id", "issue_summary"),
         )
 
-        session.add_all([project, location, resource, sensor_site, ticket])
         await session.commit()
 
     await engine.dispose()
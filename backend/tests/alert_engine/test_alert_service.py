@@ -1,7 +1,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -10,12 +10,17 @@ from backend.app.repositories.alert_repository import AlertRepository
 from backend.app.services.alert_service import AlertService
 
 
-@pytest.fixture
-def alert_repository() -> AlertRepository:
+@pytest.fixture(scope="module")
+def shared_alert_repository() -> AlertRepository:
     return AsyncMock(spec=AlertRepository)
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def alert_repository(shared_alert_repository: AlertRepository) -> AlertRepository:
+    shared_alert_repository.reset_mock(return_value=True, side_effect=True)
+    return shared_alert_repository
+
+
 async def test_create_alert_when_value_exceeds_threshold(
     alert_repository: AlertRepository,
 ) -> None:
@@ -35,7 +40,6 @@ async def test_create_alert_when_value_exceeds_threshold(
     assert alert.threshold == 25.0
 
 
-@pytest.mark.asyncio
 async def test_create_alert_when_value_does_not_exceed_threshold(
     alert_repository: AlertRepository,
 ) -> None:
@@ -51,7 +55,22 @@ async def test_create_alert_when_value_does_not_exceed_threshold(
     alert_repository.create.assert_not_called()
 
 
-@pytest.mark.asyncio
+async def test_create_alert_below_threshold_skips_alert_construction(
+    alert_repository: AlertRepository,
+) -> None:
+    alert_service = AlertService(alert_repository)
+    with patch("backend.app.services.alert_service.Alert") as alert_model:
+        alert = await alert_service.create_alert(
+            sensor_id=1,
+            metric="temperature",
+            value=25.0,
+            threshold=25.0,
+        )
+
+    assert alert is None
+    alert_model.assert_not_called()
+
+
 async def test_get_alerts_by_sensor_id(alert_repository: AlertRepository) -> None:
     alert_service = AlertService(alert_repository)
     alerts = [
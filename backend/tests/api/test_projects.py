@@ -4,11 +4,9 @@ from __future__ import annotations
 
 from datetime import date
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 async def test_create_and_retrieve_project(client: AsyncClient) -> None:
     """Ensure project creation and retrieval endpoints function correctly."""
 
@@ -34,7 +32,6 @@ async def test_create_and_retrieve_project(client: AsyncClient) -> None:
     assert fetched["primary_contact_email"] == payload["primary_contact_email"]
 
 
-@pytest.mark.asyncio
 async def test_list_projects_with_pagination(client: AsyncClient) -> None:
     """Ensure pagination metadata is returned."""
 
@@ -4,11 +4,9 @@ from __future__ import annotations
 
 from datetime import date
 
-import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
 async def test_resource_creation_rejects_invalid_project(client: AsyncClient) -> None:
     """API should reject resource creation when referencing unknown project."""
 
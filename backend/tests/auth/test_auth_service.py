@@ -7,15 +7,31 @@ import pytest
 
 from backend.app.models.user import User
 from backend.app.repositories.user_repository import UserRepository
+from backend.app.services import auth_service as auth_service_module
 from backend.app.services.auth_service import AuthService
 
+# bcrypt's cost is exponential in its rounds; the minimum keeps these tests
+# fast while still exercising the real hashing scheme.
+_FAST_CRYPT_CONTEXT = auth_service_module.crypt_context.copy(bcrypt__rounds=4)
+_TEST_PASSWORD_HASH = _FAST_CRYPT_CONTEXT.hash("testpassword")
 
-@pytest.fixture
-def user_repository() -> UserRepository:
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(auth_service_module, "crypt_context", _FAST_CRYPT_CONTEXT)
+
+
+@pytest.fixture(scope="module")
+def shared_user_repository() -> UserRepository:
     return AsyncMock(spec=UserRepository)
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def user_repository(shared_user_repository: UserRepository) -> UserRepository:
+    shared_user_repository.reset_mock(return_value=True, side_effect=True)
+    return shared_user_repository
+
+
 async def test_create_user(user_repository: UserRepository) -> None:
     auth_service = AuthService(user_repository)
     user = await auth_service.create_user("testuser", "testpassword")
@@ -24,12 +40,11 @@ async def test_create_user(user_repository: UserRepository) -> None:
     assert user.username == "testuser"
 
 
-@pytest.mark.asyncio
 async def test_authenticate_user_with_valid_credentials(
     user_repository: UserRepository,
 ) -> None:
     auth_service = AuthService(user_repository)
-    user = User(username="testuser", hashed_password=auth_service.get_password_hash("testpassword"))
+    user = User(username="testuser", hashed_password=_TEST_PASSWORD_HASH)
     user_repository.get_user_by_username.return_value = user
 
     authenticated_user = await auth_service.authenticate_user("testuser", "testpassword")
@@ -37,7 +52,6 @@ async def test_authenticate_user_with_valid_credentials(
     assert authenticated_user == user
 
 
-@pytest.mark.asyncio
 async def test_authenticate_user_with_invalid_credentials(
     user_repository: UserRepository,
 ) -> None:
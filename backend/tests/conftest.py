@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator, Generator
-from typing import AsyncGenerator
+from collections.abc import AsyncIterator, Iterator
 
 import pytest
 import pytest_asyncio
@@ -13,14 +12,24 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
-    async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import configure_mappers
 from sqlalchemy.pool import StaticPool
 
 from ..app import create_app
-from ..app.api.deps import get_db_session
-from ..app.core.database import Base
+from ..app.core.database import Base, get_session
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Drive async tests with uvloop when it is installed (uvicorn[standard])."""
+
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - Windows or minimal installs
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture(scope="session")
@@ -36,43 +45,76 @@ def test_engine() -> AsyncEngine:
 
 @pytest_asyncio.fixture(scope="session", autouse=True)
 async def prepare_database(test_engine: AsyncEngine) -> AsyncIterator[None]:
-    """Create all tables before running tests."""
+    """
+    Create all tables before running tests.
+
+    The in-memory database starts empty, so ``checkfirst`` probes are skipped
+    and the schema is discarded with the connection instead of dropped table
+    by table. Mappers are configured here too, so the first test to query
+    does not pay for resolving every relationship.
+    """
 
     async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(Base.metadata.create_all, checkfirst=False)
+    configure_mappers()
     yield
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
 
 
 @pytest_asyncio.fixture
 async def session(test_engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
-    """Yield a database session backed by the test engine."""
+    """
+    Yield a database session whose work is rolled back after the test.
+
+    The session joins an outer transaction on a dedicated connection and turns
+    its own commits into ``SAVEPOINT`` releases, so code under test can commit
+    freely while the test still leaves the shared database untouched.
+    """
+
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
 
-    SessionLocal = async_sessionmaker(test_engine, expire_on_commit=False)
-    async with SessionLocal() as session:
-        yield session
-        await session.rollback()
 
-
-@pytest_asyncio.fixture
-async def app(session: AsyncSession) -> AsyncIterator[FastAPI]:
-    """Create a FastAPI app instance with test overrides."""
+@pytest.fixture(scope="session")
+def app() -> Iterator[FastAPI]:
+    """Create the FastAPI app once; tests only swap dependency overrides."""
 
     app = create_app()
-
-    async def get_test_session() -> AsyncGenerator[AsyncSession, None]:
-        yield session
-
-    app.dependency_overrides[get_db_session] = get_test_session
     yield app
     app.dependency_overrides.clear()
 
 
-@pytest_asyncio.fixture
-async def client(app: FastAPI) -> AsyncIterator[AsyncClient]:
-    """HTTPX client bound to the FastAPI test app."""
+@pytest_asyncio.fixture(scope="session")
+async def shared_client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    """HTTPX client shared by every test in the session."""
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as client:
         yield client
+
+
+@pytest_asyncio.fixture
+async def client(
+    app: FastAPI,
+    shared_client: AsyncClient,
+    session: AsyncSession,
+) -> AsyncIterator[AsyncClient]:
+    """Bind the shared client to the current test's rollback session."""
+
+    async def get_test_session() -> AsyncSession:
+        return session
+
+    app.dependency_overrides[get_session] = get_test_session
+    shared_client.cookies.clear()
+    yield shared_client
+    app.dependency_overrides.pop(get_session, None)
@@ -0,0 +1,62 @@
+"""Repository tests for the shared ``AsyncRepository`` helpers."""
+
+from __future__ import annotations
+
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...app.repositories import ResourceRepository
+
+
+async def _create_resources(
+    repository: ResourceRepository,
+    names: List[str],
+) -> None:
+    for name in names:
+        await repository.create({"name": name, "category": "network"})
+
+
+async def test_list_returns_window_total_for_page(session: AsyncSession) -> None:
+    """Ensure the window count reports every match, not just the page."""
+
+    repository = ResourceRepository(session)
+    baseline = await repository.count()
+    await _create_resources(repository, [f"Patch Panel {i}" for i in range(5)])
+
+    items, total = await repository.list(limit=2, offset=1)
+
+    assert len(items) == 2
+    assert total == baseline + 5
+
+
+async def test_list_past_end_falls_back_to_count(session: AsyncSession) -> None:
+    """Ensure an empty page beyond the last row still reports the true total."""
+
+    repository = ResourceRepository(session)
+    await _create_resources(repository, [f"Uplink {i}" for i in range(3)])
+    total_rows = await repository.count()
+
+    items, total = await repository.list(limit=10, offset=total_rows + 5)
+
+    assert items == []
+    assert total == total_rows
+
+
+async def test_list_total_respects_search(session: AsyncSession) -> None:
+    """Ensure the total counts only rows matching the search filter."""
+
+    repository = ResourceRepository(session)
+    await _create_resources(
+        repository,
+        ["Fibre Splice A", "Fibre Splice B", "Fibre Splice C", "Core Router"],
+    )
+
+    items, total = await repository.list(limit=2, offset=0, search="fibre splice")
+    assert len(items) == 2
+    assert all(item.name.startswith("Fibre Splice") for item in items)
+    assert total == 3
+
+    items, total = await repository.list(limit=2, offset=4, search="fibre splice")
+    assert items == []
+    assert total == 3
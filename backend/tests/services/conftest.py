@@ -0,0 +1,35 @@
+"""Shared fixtures for service-layer tests."""
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional
+
+import pytest
+
+from ...app.services import BaseService
+
+
+@pytest.fixture
+def record_references(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[BaseService], List[Optional[int]]]:
+    """
+    Return a helper that records the ids a service asks to validate.
+
+    The helper wraps the service's ``ensure_references_exist`` and returns the
+    list it appends every referenced id to, ``None`` included, before the
+    real check runs.
+    """
+
+    def install(service: BaseService) -> List[Optional[int]]:
+        checked: List[Optional[int]] = []
+        ensure_references_exist = service.ensure_references_exist
+
+        async def record(references):
+            checked.extend(entity_id for _, entity_id, _ in references)
+            await ensure_references_exist(references)
+
+        monkeypatch.setattr(service, "ensure_references_exist", record)
+        return checked
+
+    return install
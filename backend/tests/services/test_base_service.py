@@ -0,0 +1,215 @@
+"""Service-layer tests for shared ``BaseService`` helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ...app.models import Location, Project
+from ...app.schemas import LocationCreate, ProjectCreate
+from ...app.services import (
+    LocationService,
+    ProjectService,
+    ValidationError,
+)
+from ...app.services.base import BaseService
+
+
+@pytest.fixture
+def executed(test_engine: AsyncEngine) -> Iterator[List[str]]:
+    """Record every ``SELECT`` sent to the database while the test runs."""
+
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+
+async def _create_project(session: AsyncSession, name: str) -> int:
+    project = await ProjectService(session).create_project(
+        ProjectCreate(
+            name=name,
+            description="Reference check fixture.",
+            primary_contact_email="ops@example.edu",
+        )
+    )
+    return project.id
+
+
+async def _create_location(session: AsyncSession) -> int:
+    location = await LocationService(session).create_location(
+        LocationCreate(campus="Main Campus", building="ICT Block", room="Lab 1")
+    )
+    return location.id
+
+
+async def test_reference_check_reports_first_missing_in_argument_order(
+    session: AsyncSession,
+) -> None:
+    """Ensure the first missing reference, as passed, names the error."""
+
+    service = BaseService(session)
+    project_id = await _create_project(session, "Campus Wi-Fi")
+
+    with pytest.raises(ValidationError, match=r"^Project 999998 does not exist\.$"):
+        await service.ensure_references_exist(
+            [
+                (Project, 999998, "Project"),
+                (Location, 999999, "Location"),
+            ]
+        )
+    with pytest.raises(ValidationError, match=r"^Location 999999 does not exist\.$"):
+        await service.ensure_references_exist(
+            [
+                (Location, 999999, "Location"),
+                (Project, 999998, "Project"),
+            ]
+        )
+    with pytest.raises(ValidationError, match=r"^Location 999999 does not exist\.$"):
+        await service.ensure_references_exist(
+            [
+                (Project, project_id, "Project"),
+                (Location, 999999, "Location"),
+            ]
+        )
+
+
+async def test_reference_check_uses_one_statement_for_several_models(
+    session: AsyncSession,
+    executed: List[str],
+) -> None:
+    """Ensure references to different tables are verified in one query."""
+
+    project_id = await _create_project(session, "Library Fibre")
+    location_id = await _create_location(session)
+    executed.clear()
+
+    await BaseService(session).ensure_references_exist(
+        [
+            (Project, project_id, "Project"),
+            (Location, location_id, "Location"),
+        ]
+    )
+
+    assert len(executed) == 1
+    assert "UNION ALL" in executed[0]
+
+
+async def test_reference_check_skips_none_ids(
+    session: AsyncSession,
+    executed: List[str],
+) -> None:
+    """Ensure omitted references add no branch and no query."""
+
+    service = BaseService(session)
+    project_id = await _create_project(session, "Lecture Hall AV")
+    executed.clear()
+
+    await service.ensure_references_exist(
+        [
+            (Project, None, "Project"),
+            (Location, None, "Location"),
+        ]
+    )
+    assert executed == []
+
+    await service.ensure_references_exist(
+        [
+            (Project, project_id, "Project"),
+            (Location, None, "Location"),
+        ]
+    )
+    assert len(executed) == 1
+    assert "UNION ALL" not in executed[0]
+
+
+async def test_verified_reference_is_served_from_cache(
+    session: AsyncSession,
+    executed: List[str],
+) -> None:
+    """Ensure a repeat lookup on the same service skips the query."""
+
+    service = BaseService(session)
+    project_id = await _create_project(session, "Research Cluster")
+    executed.clear()
+
+    await service.ensure_references_exist([(Project, project_id, "Project")])
+    assert len(executed) == 1
+
+    await service.ensure_references_exist([(Project, project_id, "Project")])
+    assert len(executed) == 1
+
+
+async def test_reference_cache_evicts_least_recent_at_capacity(
+    session: AsyncSession,
+    executed: List[str],
+) -> None:
+    """Ensure the least recently used reference is queried again at capacity."""
+
+    service = BaseService(session)
+    service.reference_cache_size = 2
+    project_ids = [
+        await _create_project(session, f"Hostel Network {index}")
+        for index in range(3)
+    ]
+    for project_id in project_ids:
+        await service.ensure_references_exist([(Project, project_id, "Project")])
+    executed.clear()
+
+    await service.ensure_references_exist([(Project, project_ids[2], "Project")])
+    assert executed == []
+
+    await service.ensure_references_exist([(Project, project_ids[0], "Project")])
+    assert len(executed) == 1
+
+
+async def test_missing_reference_is_not_cached(
+    session: AsyncSession,
+    executed: List[str],
+) -> None:
+    """Ensure a failed lookup is queried again rather than remembered."""
+
+    service = BaseService(session)
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            await service.ensure_references_exist([(Project, 999999, "Project")])
+
+    assert len(executed) == 2
+
+
+async def test_deleted_reference_is_checked_again(session: AsyncSession) -> None:
+    """Ensure a row deleted through any service on the session is not cached."""
+
+    service = BaseService(session)
+    project_id = await _create_project(session, "Decommissioned Lab")
+    await service.ensure_references_exist([(Project, project_id, "Project")])
+
+    await ProjectService(session).delete_project(project_id)
+
+    with pytest.raises(
+        ValidationError, match=rf"^Project {project_id} does not exist\.$"
+    ):
+        await service.ensure_references_exist([(Project, project_id, "Project")])
+
+
+async def test_rolled_back_reference_is_checked_again(session: AsyncSession) -> None:
+    """Ensure a reference created in rolled-back work is not served from cache."""
+
+    service = BaseService(session)
+    savepoint = await session.begin_nested()
+    project_id = await _create_project(session, "Abandoned Pilot")
+    await service.ensure_references_exist([(Project, project_id, "Project")])
+    await savepoint.rollback()
+
+    with pytest.raises(ValidationError):
+        await service.ensure_references_exist([(Project, project_id, "Project")])
@@ -0,0 +1,99 @@
+"""Service-layer tests for maintenance tickets."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...app.models import TicketSeverity, TicketStatus
+from ...app.repositories import MaintenanceTicketRepository
+from ...app.schemas import ResourceCreate, TicketCreate, TicketUpdate
+from ...app.services import (
+    MaintenanceTicketService,
+    NotFoundError,
+    ResourceService,
+    ValidationError,
+)
+
+
+async def _create_ticket(session: AsyncSession) -> int:
+    resource = await ResourceService(session).create_resource(
+        ResourceCreate(name="Edge Router", category="network")
+    )
+    ticket = await MaintenanceTicketService(session).create_ticket(
+        TicketCreate(
+            resource_id=resource.id,
+            reported_by="technician@example.edu",
+            issue_summary="Router drops BGP sessions",
+            severity=TicketSeverity.HIGH,
+            status=TicketStatus.OPEN,
+            opened_at=datetime.now(timezone.utc),
+        )
+    )
+    return ticket.id
+
+
+async def test_update_ticket_writes_and_returns_changes(session: AsyncSession) -> None:
+    """Ensure an update is persisted and reflected in the returned ticket."""
+
+    ticket_service = MaintenanceTicketService(session)
+    ticket_id = await _create_ticket(session)
+
+    updated = await ticket_service.update_ticket(
+        ticket_id,
+        TicketUpdate(
+            status=TicketStatus.CLOSED,
+            notes="Replaced line card.",
+            closed_at=datetime.now(timezone.utc),
+        ),
+    )
+
+    assert updated.id == ticket_id
+    assert updated.status == TicketStatus.CLOSED
+    assert updated.notes == "Replaced line card."
+    fetched = await ticket_service.get_ticket(ticket_id)
+    assert fetched.status == TicketStatus.CLOSED
+    assert fetched.issue_summary == "Router drops BGP sessions"
+
+
+async def test_update_ticket_validates_resolution_fields(session: AsyncSession) -> None:
+    """Ensure closing a ticket without notes is rejected before writing."""
+
+    ticket_service = MaintenanceTicketService(session)
+    ticket_id = await _create_ticket(session)
+
+    with pytest.raises(ValidationError):
+        await ticket_service.update_ticket(
+            ticket_id,
+            TicketUpdate(
+                status=TicketStatus.CLOSED,
+                closed_at=datetime.now(timezone.utc),
+            ),
+        )
+
+    fetched = await ticket_service.get_ticket(ticket_id)
+    assert fetched.status == TicketStatus.OPEN
+
+
+async def test_update_missing_ticket_raises_not_found(session: AsyncSession) -> None:
+    """Ensure updating an unknown ticket raises ``NotFoundError``."""
+
+    ticket_service = MaintenanceTicketService(session)
+
+    with pytest.raises(NotFoundError, match="Maintenance ticket 999999 not found."):
+        await ticket_service.update_ticket(
+            999999,
+            TicketUpdate(notes="No such ticket."),
+        )
+
+
+async def test_update_returning_yields_none_for_missing_row(
+    session: AsyncSession,
+) -> None:
+    """Ensure the single-statement update reports a missing row as ``None``."""
+
+    repository = MaintenanceTicketRepository(session)
+
+    assert await repository.update_returning(999999, {"notes": "Gone."}) is None
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
 
 import pytest
 
@@ -10,10 +11,12 @@ from ...app.schemas import (
     LocationCreate,
     ProjectCreate,
     ResourceCreate,
+    ResourceUpdate,
     TicketCreate,
     TicketUpdate,
 )
 from ...app.services import (
+    BaseService,
     LocationService,
     MaintenanceTicketService,
     ProjectService,
@@ -24,7 +27,6 @@ from ...app.models import LifecycleState, TicketSeverity, TicketStatus
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-@pytest.mark.asyncio
 async def test_resource_deletion_requires_closed_tickets(session: AsyncSession) -> None:
     """Ensure resources with unresolved tickets cannot be deleted."""
 
@@ -32,6 +34,7 @@ async def test_resource_deletion_requires_closed_tickets(session: AsyncSession)
     location_service = LocationService(session)
     resource_service = ResourceService(session)
     ticket_service = MaintenanceTicketService(session)
+    now = datetime.now(timezone.utc)
 
     project = await project_service.create_project(
         ProjectCreate(
@@ -64,7 +67,7 @@ async def test_resource_deletion_requires_closed_tickets(session: AsyncSession)
             issue_summary="Intermittent port failures",
             severity=TicketSeverity.HIGH,
             status=TicketStatus.OPEN,
-            opened_at=datetime.utcnow(),
+            opened_at=now,
         )
     )
 
@@ -76,8 +79,86 @@ async def test_resource_deletion_requires_closed_tickets(session: AsyncSession)
         TicketUpdate(
             status=TicketStatus.CLOSED,
             notes="Replaced faulty module.",
-            closed_at=datetime.utcnow(),
+            closed_at=now,
         ),
     )
 
     await resource_service.delete_resource(resource.id)
+
+
+async def test_list_resources_with_cursor_pages_by_id(session: AsyncSession) -> None:
+    """Ensure the offset page's cursor starts a keyset walk without overlap."""
+
+    resource_service = ResourceService(session)
+    created = [
+        await resource_service.create_resource(
+            ResourceCreate(name=f"Access Point {index}", category="network")
+        )
+        for index in range(3)
+    ]
+
+    first_page = await resource_service.list_resources(
+        limit=2,
+        offset=0,
+        search="access point",
+    )
+    assert [item.id for item in first_page.data] == [r.id for r in created[:2]]
+    assert first_page.pagination.total == 3
+    assert first_page.pagination.has_more is True
+    assert first_page.pagination.next_cursor is not None
+
+    second_page = await resource_service.list_resources(
+        limit=2,
+        offset=0,
+        search="access point",
+        cursor=first_page.pagination.next_cursor,
+    )
+    assert [item.id for item in second_page.data] == [created[2].id]
+    assert second_page.pagination.has_more is False
+    assert second_page.pagination.next_cursor is None
+
+
+async def test_update_resource_only_validates_changed_references(
+    session: AsyncSession,
+    record_references: Callable[[BaseService], List[Optional[int]]],
+) -> None:
+    """Ensure unchanged foreign keys are not re-validated on update."""
+
+    project = await ProjectService(session).create_project(
+        ProjectCreate(
+            name="Teaching Labs Refresh",
+            description="Replace lab workstations.",
+            primary_contact_email="labs@example.edu",
+        )
+    )
+    location = await LocationService(session).create_location(
+        LocationCreate(campus="Main Campus", building="Science Block", room="Lab 2")
+    )
+    resource = await ResourceService(session).create_resource(
+        ResourceCreate(
+            name="Lab Switch",
+            category="network",
+            project_id=project.id,
+            location_id=location.id,
+        )
+    )
+
+    resource_service = ResourceService(session)
+    checked = record_references(resource_service)
+
+    updated = await resource_service.update_resource(
+        resource.id,
+        ResourceUpdate(
+            name="Lab Core Switch",
+            project_id=project.id,
+            location_id=location.id,
+        ),
+    )
+    assert updated.name == "Lab Core Switch"
+    assert checked and all(entity_id is None for entity_id in checked)
+
+    with pytest.raises(ValidationError, match="Project 999999 does not exist."):
+        await resource_service.update_resource(
+            resource.id,
+            ResourceUpdate(project_id=999999, location_id=location.id),
+        )
@@ -0,0 +1,73 @@
+"""Service-layer tests for sensor sites."""
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...app.repositories import SensorSiteRepository
+from ...app.schemas import (
+    LocationCreate,
+    ProjectCreate,
+    ResourceCreate,
+    SensorSiteUpdate,
+)
+from ...app.services import (
+    BaseService,
+    LocationService,
+    ProjectService,
+    ResourceService,
+    SensorSiteService,
+    ValidationError,
+)
+
+
+async def test_update_sensor_site_only_validates_changed_references(
+    session: AsyncSession,
+    record_references: Callable[[BaseService], List[Optional[int]]],
+) -> None:
+    """Ensure unchanged foreign keys are not re-validated on update."""
+
+    project = await ProjectService(session).create_project(
+        ProjectCreate(
+            name="Flood Monitoring",
+            description="River level sensors.",
+            primary_contact_email="iot@example.edu",
+        )
+    )
+    location = await LocationService(session).create_location(
+        LocationCreate(campus="River Campus", building="Field Station", room="Hut 1")
+    )
+    resource = await ResourceService(session).create_resource(
+        ResourceCreate(name="Field Gateway", category="iot")
+    )
+    site = await SensorSiteRepository(session).create(
+        {
+            "resource_id": resource.id,
+            "project_id": project.id,
+            "location_id": location.id,
+            "data_collection_endpoint": "https://iot.example.edu/data",
+        }
+    )
+
+    site_service = SensorSiteService(session)
+    checked = record_references(site_service)
+
+    updated = await site_service.update_sensor_site(
+        site.id,
+        SensorSiteUpdate(
+            project_id=project.id,
+            location_id=location.id,
+            notes="Gauge recalibrated.",
+        ),
+    )
+    assert updated.notes == "Gauge recalibrated."
+    assert checked and all(entity_id is None for entity_id in checked)
+
+    with pytest.raises(ValidationError, match="Location 999999 does not exist."):
+        await site_service.update_sensor_site(
+            site.id,
+            SensorSiteUpdate(project_id=project.id, location_id=999999),
+        )
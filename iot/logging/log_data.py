@@ -4,29 +4,154 @@ Flask-based ingestion endpoint for LifeLine-ICT IoT sensor data.
 Receives POST requests from ESP32 or similar devices and logs the data.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request
+from flask.json.provider import JSONProvider
+import atexit
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import threading
+from datetime import datetime, timezone
 import os
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask's stdlib provider is the fallback
+    orjson = None
 
 app = Flask(__name__)
 
-# Configure logging
+
+class OrjsonProvider(JSONProvider):
+    """Parse request bodies and encode responses with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue raw records without blocking; drop and count them when the queue is full."""
+
+    dropped = 0
+    _dropped_lock = threading.Lock()
+
+    def prepare(self, record):
+        # The listener is a thread in this process, so the record can be
+        # queued as-is. The stock prepare() formats it here, which would put
+        # the message and the payload repr back on the request thread.
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Counted rather than reported: handleError would write a traceback
+            # to stderr on the request thread for every dropped record.
+            with self._dropped_lock:
+                DroppingQueueHandler.dropped += 1
+
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    """Queue listener whose shutdown sentinel waits for room in a full queue."""
+
+    def enqueue_sentinel(self):
+        # The listener thread is still draining, so a blocking put always
+        # completes instead of raising queue.Full at exit.
+        self.queue.put(self._sentinel)
+
+    def stop(self):
+        super().stop()
+        if DroppingQueueHandler.dropped:
+            # Written after the listener has drained, so it is the last line
+            # in the log rather than competing with a full queue.
+            self.handle(
+                logging.makeLogRecord(
+                    {
+                        "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": "Dropped %d log records: log queue was full",
+                        "args": (DroppingQueueHandler.dropped,),
+                    }
+                )
+            )
+
+
+# Configure logging. Request threads only enqueue records; a single listener
+# thread owns the file handler and performs the disk writes, so ingestion is
+# never blocked on log I/O. The queue is bounded so a stalled disk sheds
+# records, counted in DroppingQueueHandler.dropped, instead of growing memory
+# without limit.
 os.makedirs("logs", exist_ok=True)
+_log_queue = queue.Queue(maxsize=10000)
+_file_handler = logging.FileHandler("logs/sensor_data.log")
+_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+)
+_log_listener = DrainingQueueListener(_log_queue, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# Records reach the file handler unformatted, so its formatter is the only one
+# applied and all message formatting happens on the listener thread.
 logging.basicConfig(
-    filename="logs/sensor_data.log",
     level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(message)s"
+    handlers=[DroppingQueueHandler(_log_queue)],
 )
 
+# Second of the last formatted timestamp and its ISO-8601 text, swapped as one
+# tuple so concurrent request threads never see a mismatched pair. Devices
+# report in bursts, so most requests reuse the cached date/time portion and
+# only format the milliseconds.
+_last_second = (-1, "")
+
+
+def _utc_timestamp():
+    """Return the current UTC time as ISO-8601 text with milliseconds."""
+    global _last_second
+    now = time.time()
+    second = int(now)
+    cached_second, text = _last_second
+    if second != cached_second:
+        text = datetime.fromtimestamp(second, timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+        _last_second = (second, text)
+    return f"{text}.{int((now - second) * 1000):03d}"
+
+# Response bodies, encoded once. Only the timestamp varies, so the success
+# body is spliced together from bytes instead of going through a JSON encoder.
+# A fresh Response still wraps each body because Flask may add headers to the
+# response object it returns.
+_NO_PAYLOAD_BODY = b'{"error":"No JSON payload received"}\n'
+_OK_BODY_HEAD = b'{"status":"ok","timestamp":"'
+_OK_BODY_TAIL = b'"}\n'
+
 @app.route("/data", methods=["POST"])
 def ingest_data():
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "No JSON payload received"}), 400
+    # silent=True turns malformed or non-JSON bodies into None so they take
+    # the same cheap 400 path instead of raising through Werkzeug.
+    data = request.get_json(silent=True)
+    if not data or not isinstance(data, dict):
+        return app.response_class(
+            _NO_PAYLOAD_BODY, status=400, mimetype="application/json"
+        )
     # Log the data
-    logging.info(f"Received data: {data}")
-    return jsonify({"status": "ok", "timestamp": datetime.utcnow().isoformat()}), 200
+    logging.info("Received data: %s", data)
+    return app.response_class(
+        _OK_BODY_HEAD + _utc_timestamp().encode() + _OK_BODY_TAIL,
+        status=200,
+        mimetype="application/json",
+    )
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # The debugger and reloader are opt-in via FLASK_DEBUG; they must never
+    # run on a device-facing deployment.
+    debug = os.environ.get("FLASK_DEBUG", "").lower() in ("1", "true")
+    app.run(host="0.0.0.0", port=5000, debug=debug, use_reloader=False)